@@ -0,0 +1,126 @@
+"""
+Benchmarks the compression options of the local saving agent.
+
+For each compression ('none', 'gzip', and 'zstd', if the package
+*zstandard* is installed), a number of varied session documents is
+written to a temporary directory and read back with
+:meth:`.DataManager.iterate_local_data`. The script reports the bytes
+written per session and the write and read throughput.
+
+Usage::
+
+    python benchmarks/compression.py --sessions 500 --elements 300
+"""
+
+import argparse
+import random
+import string
+import tempfile
+import time
+from pathlib import Path
+
+from alfred3 import saving_agent
+from alfred3.data_manager import DataManager
+from alfred3.exceptions import SavingAgentException
+
+
+def session_doc(rng: random.Random, sid: int, n_elements: int) -> dict:
+    """Returns a session document with varied element values."""
+    doc = {field: None for field in saving_agent.SessionManifest.fields}
+    doc.update(
+        type=DataManager.EXP_DATA,
+        exp_session_id=f"sid-{sid}-{rng.getrandbits(64):x}",
+        exp_start_time=time.time() - rng.uniform(0, 3600),
+        exp_finished=rng.random() < 0.8,
+    )
+
+    exp_data = {}
+    for i in range(n_elements):
+        kind = rng.choice(["TextEntry", "NumberEntry", "SingleChoice"])
+        if kind == "TextEntry":
+            length = rng.randint(0, 120)
+            value = "".join(rng.choices(string.ascii_letters + " ", k=length))
+        elif kind == "NumberEntry":
+            value = round(rng.uniform(-1000, 1000), rng.randint(0, 4))
+        else:
+            value = rng.randint(1, 7)
+
+        exp_data[f"el{i}"] = {
+            "name": f"el{i}",
+            "value": value,
+            "element_type": kind,
+            "label": f"Question {i}",
+        }
+    doc["exp_data"] = exp_data
+
+    doc["exp_move_history"] = [
+        {
+            "move_number": i,
+            "tag": f"page{i}",
+            "show_time": rng.uniform(0, 1e9),
+            "duration": rng.uniform(0.5, 120),
+        }
+        for i in range(rng.randint(5, 50))
+    ]
+    return doc
+
+
+def run(compression: str, docs: list, directory: Path) -> dict:
+    suffix = saving_agent.DATA_SUFFIXES[compression]
+    directory.mkdir()
+
+    start = time.perf_counter()
+    for i, doc in enumerate(docs):
+        path = directory / f"{i}{suffix}"
+        path.write_bytes(saving_agent.encode_data_file(path, doc))
+    write_duration = time.perf_counter() - start
+
+    raw = sum(len(saving_agent.encode_data_file("x.json", doc)) for doc in docs)
+
+    size = sum(fp.stat().st_size for fp in directory.iterdir())
+
+    start = time.perf_counter()
+    n = sum(1 for _ in DataManager.iterate_local_data(DataManager.EXP_DATA, directory))
+    read_duration = time.perf_counter() - start
+
+    return {
+        "bytes": size / len(docs),
+        "ratio": raw / size,
+        "write": len(docs) / write_duration,
+        "write_mb": raw / write_duration / 1e6,
+        "read": n / read_duration,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--sessions", type=int, default=500)
+    parser.add_argument("--elements", type=int, default=300)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    docs = [session_doc(rng, i, args.elements) for i in range(args.sessions)]
+
+    compressions = ["none", "gzip"]
+    try:
+        saving_agent._import_zstandard()
+        compressions.append("zstd")
+    except SavingAgentException:
+        print("zstandard is not installed, skipping zstd.")
+
+    print(
+        f"{'compression':<12}{'bytes/session':>15}{'ratio':>8}"
+        f"{'write/s':>10}{'write MB/s':>12}{'read/s':>10}"
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        for compression in compressions:
+            r = run(compression, docs, Path(tmp) / compression)
+            print(
+                f"{compression:<12}{r['bytes']:>15.0f}{r['ratio']:>8.2f}"
+                f"{r['write']:>10.0f}{r['write_mb']:>12.1f}{r['read']:>10.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()